@@ -1,8 +1,12 @@
 # Basic imports
+import functools
+import logging
 import pykep as pk
 import numpy as np
-import scipy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components, dijkstra
 import os
+from concurrent.futures import ThreadPoolExecutor
 from matplotlib import pyplot as plt
 import seaborn as sns
 
@@ -11,14 +15,85 @@ import seaborn as sns
 from sgp4.api import Satrec, SatrecArray
 from sgp4.api import WGS72
 
-# Networkx
-import networkx as nx
+# Lazily-formatted diagnostics for the plot path (no string work unless enabled)
+logger = logging.getLogger(__name__)
+
+
+# Numba (optional) - used to JIT-compile the pairwise graph kernel when available;
+# a vectorized NumPy path is kept as a fallback
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    # nogil so that the independent per-epoch graph builds can run concurrently
+    # in the fitness thread pool (epoch-level parallelism replaces prange here)
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _build_edges(P, num_w1_sats, eta1, eta2, LOS, eps_z, n_rovers):
+        """JIT-compiled pairwise kernel of build_graph: emits the (rows, cols, data)
+        edge triplets and the minimum link distance for one epoch (see build_graph)"""
+        N = P.shape[0]
+        # Worst case is the full lower triangle
+        max_edges = N * (N - 1) // 2
+        rows = np.empty(max_edges, dtype=np.int32)
+        cols = np.empty(max_edges, dtype=np.int32)
+        data = np.empty(max_edges)
+        n_edges = 0
+        d_min_row = np.full(N, np.inf)
+        for i in range(N):
+            norm_i2 = P[i, 0]**2 + P[i, 1]**2 + P[i, 2]**2
+            norm_i = np.sqrt(norm_i2)
+            for j in range(i):
+                dx = P[j, 0] - P[i, 0]
+                dy = P[j, 1] - P[i, 1]
+                dz = P[j, 2] - P[i, 2]
+                dist = np.sqrt(dx * dx + dy * dy + dz * dz)
+                if dist < 1e-6:
+                    # if r1 ~= r2, the line of sight is the norm of r1
+                    los = norm_i
+                    cos_theta_z = 0.0
+                else:
+                    h1 = (dx * P[i, 0] + dy * P[i, 1] + dz * P[i, 2]) / dist
+                    arg = norm_i2 - h1 * h1
+                    # We check for a positive arg in case r1 and r2 are near collinearity
+                    los = np.sqrt(arg) if arg > 1e-6 else 0.0
+                    cos_theta_z = h1 / norm_i
+                # Ensure there is LOS
+                if los >= LOS or cos_theta_z > 0:
+                    # Eta based on j because it is the destination satellite in the link
+                    eta_j = eta1 if j < num_w1_sats else eta2
+                    if dist < d_min_row[i]:
+                        d_min_row[i] = dist
+                    edge = -np.log(eta_j) + 2.0 * np.log(dist)
+                    if edge < 0:
+                        # Safeguard against negative edge weights (see qkd_metric)
+                        edge = 1e3
+                    if i >= N - n_rovers:
+                        # Apply max zenith angle constraint to mothership-rover links
+                        if cos_theta_z >= eps_z:
+                            edge += 1.0 / cos_theta_z
+                        else:
+                            edge = 0.0
+                    # Only the lower triangle is emitted and zero weights are
+                    # absent edges; consumers treat the graph as undirected
+                    if edge != 0:
+                        rows[n_edges] = i
+                        cols[n_edges] = j
+                        data[n_edges] = edge
+                        n_edges += 1
+        return rows[:n_edges], cols[:n_edges], data[:n_edges], d_min_row.min()
 
 # Static data
+@functools.lru_cache(maxsize=1)
 def get_mothership_satellites():
     """Construct array of mothership orbital elements
     (the TLEs of actual Earth-orbiting satellites below are used as a proxy for
     plausible orbital dynamics around a habitable planet)
+
+    The parsed satellites are cached: the TLEs are static and twoline2rv is not
+    free, so each UDP instance (e.g. in a pygmo archipelago) reuses them.
     """
     mothership_tles = [
         [
@@ -55,7 +130,75 @@ def get_mothership_satellites():
     motherships = []
     for tle in mothership_tles:
         motherships.append(Satrec.twoline2rv(tle[0], tle[1]))
-    return motherships
+    return tuple(motherships)
+
+
+def _walk_predecessors(pred, src_node, dst_node):
+    """Rebuilds the shortest path from a Dijkstra predecessor array by walking
+    back from the destination (no per-node path-dict construction)"""
+    path = []
+    node = dst_node
+    while node != src_node:
+        path.append(node)
+        node = int(pred[node])
+    path.append(src_node)
+    path.reverse()
+    return path
+
+
+@functools.lru_cache(maxsize=16)
+def _partition_indices(n_nodes, src, dst):
+    """Node indices of the mothership (source) partition, cached across the
+    per-epoch shortest-path sweeps of a fitness call."""
+    return np.arange(n_nodes - src - dst, n_nodes - dst)
+
+
+@functools.lru_cache(maxsize=16)
+def _node_masks(N, num_w1_sats, n_rovers):
+    """Boolean node masks for the graph construction: membership of the first
+    Walker constellation and the rover rows. Cached because build_graph is
+    called once per epoch with identical node counts within a fitness call.
+    """
+    is_w1 = np.arange(N) < num_w1_sats
+    rover_row = (np.arange(N) >= N - n_rovers)[:, None]
+    return is_w1, rover_row
+
+
+@functools.lru_cache(maxsize=256)
+def _generate_walker_cached(S, P, F, a, e, incl, w, epoch_days):
+    """Constructs a Walker constellation as a SatrecArray (see constellation_udp.generate_walker).
+
+    Cached on the (quantized) orbital elements: optimizers typically re-evaluate
+    identical integer (S, P, F) and near-identical floats, so the repeated
+    sgp4init cost is avoided entirely on cache hits.
+    """
+    mean_motion = np.sqrt(pk.MU_EARTH/a**3/pk.EARTH_RADIUS**3)
+    # Mean anomaly and R.A. of ascending node of every satellite, precomputed in one pass
+    planes = np.arange(P)
+    sats = np.arange(S)
+    mo = (2*np.pi/P/S*F*planes[:, None] + 2.*np.pi/S*sats[None, :]).ravel()
+    nodeo = np.repeat(2.*np.pi/P*planes, S)
+    no_kozai = mean_motion * 60
+    walker_l = []
+    for satnum, (mo_k, nodeo_k) in enumerate(zip(mo, nodeo)):
+        satellite = Satrec()
+        satellite.sgp4init(
+            WGS72,              # gravity model
+            'i',                # 'a' = old AFSPC mode, 'i' = improved mode
+            satnum,             # satnum: Satellite number
+            epoch_days,         # epoch: days since 1949 December 31 00:00 UT
+            0.0,                # bstar: drag coefficient (1/earth radii) - 3.8792e-05
+            0.0,                # ndot: ballistic coefficient (revs/day)
+            0.0,                # nddot: mean motion 2nd derivative (revs/day^3)
+            e,                  # ecco: eccentricity
+            w,                  # argpo: argument of perigee (radians)
+            incl,               # inclo: inclination (radians)
+            mo_k,               # mo: mean anomaly (radians)
+            no_kozai,           # no_kozai: mean motion (radians/minute)
+            nodeo_k             # nodeo: R.A. of ascending node (radians)
+        )
+        walker_l.append(satellite)
+    return tuple(walker_l)
 
 
 class constellation_udp:
@@ -66,6 +209,11 @@ class constellation_udp:
 
     The constellations must relay information between 7 motherships in orbit and 4 rovers on the surface of New Mars
     """
+
+    # Unit-sphere mesh for plotting the New Mars surface (computed lazily, shared
+    # by all instances and scaled by the planet radius per plot)
+    _UNIT_SPHERE = None
+
     def __init__(self):
         """Constructor"""
 
@@ -76,14 +224,19 @@ class constellation_udp:
         jd0, fr = pk.epoch(self._t0, 'mjd2000').jd, 0.0 # reference Julian date
         self.jds = np.linspace(jd0, jd0 + self._duration * 365.25, self.n_epochs) # time grid in JD
         self.frs = self.jds * fr # date fractions (defaults to 0)
+        # Epoch 0 is never used by the fitness (graphs are built from epoch 1 onwards),
+        # so all SGP4 propagations are restricted to the evaluation grid below;
+        # self.jds[0] is kept only as the reference epoch (rovers, plots)
+        self.jds_eval = self.jds[1:]
+        self.frs_eval = self.frs[1:]
 
         # Reference epoch for SGP4 is 1949 December 31 00:00 UT
         self.ep_ref = pk.epoch_from_iso_string("19491231T000000")
 
-        # SGP4-ready mothership satellites
-        mothership_satellites = get_mothership_satellites()
-        self.pos_m = self.construct_mothership_pos(SatrecArray(mothership_satellites))
-        self.n_motherships = len(mothership_satellites)
+        # SGP4-ready mothership satellites (kept as a list so they can be batched
+        # together with the Walker satellites in a single SGP4 sweep)
+        self._motherships = get_mothership_satellites()
+        self.n_motherships = len(self._motherships)
 
         # Latitudes and longitudes of rovers
         rovers_db_path = os.path.join(".", "data", "spoc2", "constellations", "rovers.txt")
@@ -106,6 +259,20 @@ class constellation_udp:
         # Minimum inter-satellite distance (km)
         self._min_sat_dist = 50
 
+        # Memoized fitness evaluations, keyed on the quantized chromosome
+        self._fitness_cache = {}
+        # Memoized communications graphs for plotting, keyed on (epoch, chromosome)
+        self._plot_graph_cache = {}
+        # Reused 3D axes for repeated plot() calls (created lazily on first plot)
+        self._plot_ax = None
+
+        # Preallocated position buffer sized for the largest possible constellation
+        # (reused across fitness evaluations to avoid per-call allocations)
+        ub = self.get_bounds()[1]
+        self._max_n = int(ub[10]) * int(ub[11]) + int(ub[13]) * int(ub[14]) \
+            + self.n_motherships + self.n_rovers
+        self._cum_pos_buf = np.empty((self._max_n, self.jds_eval.shape[0], 3), dtype=np.float32)
+
     def get_bounds(self):
         """Get bounds for the decision variables.
 
@@ -150,20 +317,16 @@ class constellation_udp:
         Returns
             float: the difference between the actual and allowable minimum distance between rovers
         """
-        # Compute rover positions on the planet
+        # Compute rover positions on the planet (unit sphere, standard spherical convention)
         pos = np.zeros((self.n_rovers, 3))
-        pos[:, 0] = np.sin(lambda0) * np.cos(phi0)
-        pos[:, 1] = np.cos(lambda0) * np.cos(phi0)
-        pos[:, 2] = np.sin(phi0)
-        def safe_arccos(u, v):
-            inner_product = np.dot(u, v)
-            if inner_product > 1:
-                return 0
-            if inner_product < -1:
-                return np.pi
-            return np.arccos(inner_product)
-        d = scipy.spatial.distance.cdist(pos, pos, lambda u, v: pk.EARTH_RADIUS/1000 * safe_arccos(u, v))
-        d = d + np.diag([np.inf]*4)
+        pos[:, 0] = np.cos(lambda0) * np.cos(phi0)
+        pos[:, 1] = np.cos(lambda0) * np.sin(phi0)
+        pos[:, 2] = np.sin(lambda0)
+        # Great-circle distances via the clipped Gram matrix (clipping guards the
+        # arccos against inner products marginally outside [-1, 1])
+        gram = np.clip(pos @ pos.T, -1.0, 1.0)
+        d = pk.EARTH_RADIUS / 1000 * np.arccos(gram)
+        np.fill_diagonal(d, np.inf)
         min_d = np.min(d)
         # Will be negative if min(d) is larger than the min allowable inter-rover distance
         return self._min_rover_dist - min_d, min_d
@@ -188,15 +351,11 @@ class constellation_udp:
             r2 (numpy array): second point
         """
         denom = np.linalg.norm(r2-r1)
-        if denom < 1e-6:
-            # if r1 ~= r2, it will return the norm of r1
-            return np.linalg.norm(r1)
-        else:
-            r21 = (r2-r1) / denom
-            h1 = np.dot(r1,r21)
-            arg = np.linalg.norm(r1)**2 - h1**2
-            # We check for a positive arg in case r1 and r2 are near collinearity
-            return np.sqrt(arg) if arg > 1e-6 else 0.0
+        h1 = np.dot(r1, r2-r1) / np.where(denom < 1e-6, 1.0, denom)
+        # We clamp the arg at zero in case r1 and r2 are near collinearity
+        arg = np.maximum(np.linalg.norm(r1)**2 - h1**2, 0.0)
+        # if r1 ~= r2, it will return the norm of r1
+        return float(np.where(denom < 1e-6, np.linalg.norm(r1), np.sqrt(arg)))
 
     def zenith_angle(self, src, dst):
         """Computes the cosine of the zenith angle (theta_z) of the LOS between source and destination node
@@ -209,11 +368,9 @@ class constellation_udp:
             float: cosine of the zenith angle
         """
         dpos = dst - src
-        if np.linalg.norm(dpos) < 1e-6:
-            cos_theta_z = 0
-        else:
-            cos_theta_z = np.dot(dpos, src) / (np.linalg.norm(dpos) * np.linalg.norm(src))
-        return cos_theta_z
+        norm_dpos = np.linalg.norm(dpos)
+        denom = np.where(norm_dpos < 1e-6, 1.0, norm_dpos * np.linalg.norm(src))
+        return float(np.where(norm_dpos < 1e-6, 0.0, np.dot(dpos, src) / denom))
 
     def qkd_metric(self, idx, src, dst, cos_theta_z, eta):
         """Computes the edge weight according to QKD probabilities
@@ -242,41 +399,40 @@ class constellation_udp:
 
         if idx <= self.n_rovers:
             if cos_theta_z >= self.eps_z: # Apply max zenith angle constraint to mothership-rover link
-                edge_weight += 1.0 / np.sin(np.pi / 2 - np.arccos(cos_theta_z))
+                # 1 / sin(pi/2 - arccos(cos_theta_z)) simplifies to 1 / cos_theta_z
+                edge_weight += 1.0 / cos_theta_z
             else:
                 edge_weight = 0
         return edge_weight, d_link
 
-    def average_shortest_path(self, G, src, dst, epoch, verbose=False):
-        """Computes the average shortest path length between the source and destination *partitions* of nodes in the graph *G*
+    def average_shortest_path(self, adjmatrix, src, dst, epoch, verbose=False):
+        """Computes the average shortest path length between the source and destination *partitions* of nodes in the graph
         (the source is assumed to be the motherships and the destination the rovers)
 
         Args:
-            G (networkx graph): The graph
-            src (int): the number of motherships (to be used as a negative index in G)
-            dst (int): the number of rovers (to be used as a negative index in G)
+            adjmatrix (scipy.sparse.csr_matrix, N x N): adjacency matrix of the graph
+            src (int): the number of motherships (to be used as a negative index in the adjacency matrix)
+            dst (int): the number of rovers (to be used as a negative index in the adjacency matrix)
             epoch (int): the current epoch (for error handling purposes only)
             verbose (bool): turn on flag for additional logs
 
         Returns:
             float: average shortest path
         """
-        retval = 0.
-        n_nodes = len(G.nodes())
-        for i in range(dst):
-            for j in range(src):
-                # Find the shortest path if one exists
-                try:
-                    retval += nx.shortest_path_length(G, n_nodes - src - dst + j, n_nodes - dst + i, weight='weight', method='dijkstra')
-                except nx.exception.NetworkXNoPath as err:
-                    if verbose:
-                        print("Mothership {} (node {}) cannot reach rover {} (node {}) at epoch {}".format(\
-                            j + 1, n_nodes - src - dst + j, i + 1,  n_nodes - dst + i, epoch))
-                    retval += 1e4
-        return retval / src / dst
+        n_nodes = adjmatrix.shape[0]
+        # One multi-source Dijkstra sweep in C from all motherships at once
+        d = dijkstra(csgraph=adjmatrix, directed=False,
+                     indices=_partition_indices(n_nodes, src, dst))
+        # Keep only the rover columns; an infinite distance means no path exists
+        d = d[:, n_nodes - dst:]
+        if verbose:
+            for j, i in np.argwhere(np.isinf(d)):
+                print(f"Mothership {j + 1} (node {n_nodes - src - dst + j}) cannot reach "
+                      f"rover {i + 1} (node {n_nodes - dst + i}) at epoch {epoch}")
+        return np.where(np.isinf(d), 1e4, d).mean()
 
     def generate_walker(self, S,P,F,a,e,incl,w,t0):
-        """Generates a Walker constallation as a SatrecArray
+        """Generates a Walker constallation as a tuple of Satrec satellites
 
         Args:
             S (int): number of satellites per plane
@@ -289,64 +445,86 @@ class constellation_udp:
             t0 (float): epoch
 
         Returns:
-            SatrecArray: satellites ready to be SGP4 propagated
+            tuple of Satrec: satellites ready to be SGP4 propagated
         """
-        walker_l = []
-        mean_motion = np.sqrt(pk.MU_EARTH/a**3/pk.EARTH_RADIUS**3)
-        # planes
-        for i in range(P):
-            #satellites
-            for j in range(S):
-                satellite = Satrec()
-                satellite.sgp4init(
-                    WGS72,                            # gravity model
-                    'i',                              # 'a' = old AFSPC mode, 'i' = improved mode
-                    j + i*S,                          # satnum: Satellite number
-                    t0-self.ep_ref.mjd2000,           # epoch: days since 1949 December 31 00:00 UT
-                    0.0,                              # bstar: drag coefficient (1/earth radii) - 3.8792e-05
-                    0.0,                              # ndot: ballistic coefficient (revs/day)
-                    0.0,                               # nddot: mean motion 2nd derivative (revs/day^3)
-                    e,                                # ecco: eccentricity
-                    w,                                # argpo: argument of perigee (radians)
-                    incl,                             # inclo: inclination (radians)
-                    2*np.pi/P/S*F*i+2.*np.pi/S*j,     # mo: mean anomaly (radians)
-                    mean_motion*60,                   # no_kozai: mean motion (radians/minute)
-                    2.*np.pi/P*i                      # nodeo: R.A. of ascending node (radians)
-                )
-                walker_l.append(satellite)
-        # Creating the vectorized list
-        return SatrecArray(walker_l)
+        # Quantize the continuous elements so that re-evaluated chromosomes
+        # produce cache hits in _generate_walker_cached. The quantization only
+        # strips float noise well below the propagation sensitivity: over the
+        # 10-year horizon even a 1e-6 perturbation of the semi-major axis
+        # accumulates into km-scale position errors
+        return _generate_walker_cached(int(S), int(P), int(F), round(a, 12), round(e, 12),
+                                       round(incl, 12), round(w, 12), t0-self.ep_ref.mjd2000)
     
     def build_graph(self, ep_idx, pos, num_w1_sats, eta):
-        """Builds a networkx graph from the satellite positions. Links are weighted via a "QKD-inspired metric
-        and only exist when motherships/constellation satellites/rovers have line-of-sight
+        """Builds the sparse adjacency matrix of the communications graph from the satellite positions.
+        Links are weighted via a "QKD-inspired metric and only exist when motherships/constellation
+        satellites/rovers have line-of-sight
 
         Args:
             ep_idx (int): idx of the epoch in the time grid 
-            pos (numpy array 3xN): position vector of the satellites
+            pos (numpy array, n_epochs x N x 3): epoch-major position vector of the satellites
             num_w1_sats (int): number of satellites in the first Walker constellation
             eta (tuple): satellite quality indicator for each Walker constellation
 
         Returns:
-            networkx graph: nodes are motherships/Walker satellites/rovers; links are distances when there is LOS
+            scipy.sparse.csr_matrix: lower-triangular adjacency matrix (the graph is
+                undirected); nodes are motherships/Walker satellites/rovers
+            float: minimum link distance over all pairs with LOS
         """
-        N = pos[:, ep_idx, :].shape[0] # number of vertices
-        adjmatrix = np.zeros((N, N))
-        d_min = np.inf
-        for i in range(N):
-            for j in range(i):
-                # Ensure there is LOS
-                los = self.line_of_sight(pos[i, ep_idx, :], pos[j, ep_idx, :])
-                cos_theta_z = self.zenith_angle(pos[i, ep_idx, :], pos[j, ep_idx, :])
-
-                if los >= self.LOS or cos_theta_z > 0:
-                    # Eta based on j because it is the destination satellite in the link
-                    eta_j = eta[0] if j < num_w1_sats else eta[1]
-                    adjmatrix[i,j], d_link = self.qkd_metric(N-i, pos[i, ep_idx, :], pos[j, ep_idx, :], cos_theta_z, eta_j)
-                    if d_link < d_min:
-                        d_min = d_link
-                    adjmatrix[j,i] = adjmatrix[i,j]
-        return nx.from_numpy_array(adjmatrix), adjmatrix, d_min
+        P = pos[ep_idx]
+        N = P.shape[0] # number of vertices
+
+        if _HAS_NUMBA:
+            rows, cols, data, d_min = _build_edges(np.ascontiguousarray(P), int(num_w1_sats),
+                                                   float(eta[0]), float(eta[1]),
+                                                   self.LOS, self.eps_z, self.n_rovers)
+            return coo_matrix((data, (rows, cols)), shape=(N, N)).tocsr(), d_min
+
+        # Pairwise geometry, computed in one pass over the full N x N block
+        # (diff[i, j] is the vector from node i to node j, matching r2 - r1 in line_of_sight)
+        diff = P[None, :, :] - P[:, None, :]
+        dist = np.linalg.norm(diff, axis=2)
+        norms = np.linalg.norm(P, axis=1)
+        # Degenerate pairs (coincident nodes and the diagonal) are given a unit
+        # distance so the divisions below are well defined; they are fixed up after
+        degenerate = dist < 1e-6
+        safe_dist = np.where(degenerate, 1.0, dist)
+        # Distance of the line of sight to the origin (see line_of_sight)
+        h1 = np.einsum('ijk,ik->ij', diff, P) / safe_dist
+        arg = norms[:, None]**2 - h1**2
+        los = np.sqrt(np.maximum(arg, 0.0))
+        los = np.where(degenerate, norms[:, None], los)
+        # Cosine of the zenith angle (see zenith_angle)
+        cos_theta_z = np.where(degenerate, 0.0, h1 / norms[:, None])
+
+        # Edge weights via the QKD-inspired metric (see qkd_metric)
+        # Eta based on the column because it is the destination satellite in the link
+        is_w1, rover_row = _node_masks(N, int(num_w1_sats), self.n_rovers)
+        eta_vec = np.where(is_w1, eta[0], eta[1])
+        with np.errstate(divide='ignore'):
+            edge = -np.log(eta_vec)[None, :] + 2.0 * np.log(dist)
+        # Safeguard: whenever this happens, the collision-avoidance constraint is
+        # also not satisfied. Nevertheless, we must return a value for the edge weight
+        # to ensure that the fitness does not throw (a negative valued edge would also
+        # imply the non-existence of a shortest path)
+        edge = np.where(edge < 0, 1e3, edge)
+        # Apply max zenith angle constraint to mothership-rover links
+        # (the rovers occupy the last n_rovers rows)
+        with np.errstate(divide='ignore'):
+            edge = np.where(rover_row & (cos_theta_z >= self.eps_z), edge + 1.0 / cos_theta_z, edge)
+        edge = np.where(rover_row & (cos_theta_z < self.eps_z), 0.0, edge)
+
+        # Ensure there is LOS, keeping only the i > j pairs of the original loop
+        mask = (los >= self.LOS) | (cos_theta_z > 0)
+        mask &= np.tri(N, k=-1, dtype=bool)
+        d_min = dist[mask].min() if mask.any() else np.inf
+
+        # Assemble the sparse adjacency directly from the masked pair list,
+        # dropping zero-weight links (absent edges) to match the dense semantics;
+        # only one triangle is stored, consumers treat the graph as undirected
+        i_idx, j_idx = np.nonzero(mask & (edge != 0))
+        adjmatrix = coo_matrix((edge[i_idx, j_idx], (i_idx, j_idx)), shape=(N, N)).tocsr()
+        return adjmatrix, d_min
 
     def construct_walkers(self, x):
         """Generates two Walker constellations according to specifications
@@ -355,14 +533,14 @@ class constellation_udp:
             x (list): chromosome describing the New Mars communications infrastructure
 
         Returns:
-            SatrecArray: Walker1 constellation satellites ready to be SGP4 propagated
-            SatrecArray: Walker2 constellation satellites ready to be SGP4 propagated
+            tuple of Satrec: Walker1 constellation satellites ready to be SGP4 propagated
+            tuple of Satrec: Walker2 constellation satellites ready to be SGP4 propagated
         """
         # Parse the chromosome
         a1,e1,i1,w1,_,a2,e2,i2,w2,_,S1,P1,F1,S2,P2,F2,_,_,_,_ = x
-        # Construct the 1st walker constellation as a SatrecArray
+        # Construct the 1st walker constellation
         walker1 = self.generate_walker(int(S1),int(P1),int(F1),a1,e1,i1,w1,self._t0)
-        # Construct the 2nd walker constellation as a SatrecArray
+        # Construct the 2nd walker constellation
         walker2 = self.generate_walker(int(S2),int(P2),int(F2),a2,e2,i2,w2,self._t0)
         return walker1, walker2
 
@@ -373,10 +551,11 @@ class constellation_udp:
             motherships (SatrecArray): mothership satellites ready to be SGP4 propagated
 
         Returns:
-            float, n_motherships x n_epochs x 3: mothership x, y, z positions
+            float, n_motherships x (n_epochs - 1) x 3: mothership x, y, z positions
+            (epoch 0 is excluded from propagation)
         """
 
-        err, pos, _ = motherships.sgp4(self.jds, self.frs)
+        err, pos, _ = motherships.sgp4(self.jds_eval, self.frs_eval)
         # Check propagation went well
         if not np.all(err == 0):
             raise ValueError("The motherships cannot be propagated succesfully on the defined time grid")
@@ -390,14 +569,17 @@ class constellation_udp:
             phi0 (float, N_r x 1): initial longitudes of the rovers
 
         Returns:
-            float, n_rovers x n_epochs x 3: rover x, y, z positions
+            float, n_rovers x (n_epochs - 1) x 3: rover x, y, z positions
+            (epoch 0 is excluded from propagation)
         """
-        pos_r = np.zeros((self.n_rovers, self.jds.shape[0], 3))
-        time_range = (self.jds - self.jds[0]) * 24 * 3600 # in seconds
-        for i, t in enumerate(time_range):
-            pos_r[:, i, 0] = self.R_p * np.cos(lambda0) * np.cos(phi0 + self.w_p * t) # x
-            pos_r[:, i, 1] = self.R_p * np.cos(lambda0) * np.sin(phi0 + self.w_p * t) # y
-            pos_r[:, i, 2] = self.R_p * np.sin(lambda0) # z
+        time_range = (self.jds_eval - self.jds[0]) * 24 * 3600 # in seconds
+        # Longitude of each rover at each epoch (n_rovers x n_epochs-1, by broadcasting)
+        ang = phi0[:, None] + self.w_p * time_range[None, :]
+        cos_lambda0 = np.cos(lambda0)[:, None]
+        pos_r = np.empty((self.n_rovers, self.jds_eval.shape[0], 3))
+        pos_r[:, :, 0] = self.R_p * cos_lambda0 * np.cos(ang) # x
+        pos_r[:, :, 1] = self.R_p * cos_lambda0 * np.sin(ang) # y
+        pos_r[:, :, 2] = self.R_p * np.sin(lambda0)[:, None] # z
 
         return pos_r
 
@@ -405,27 +587,39 @@ class constellation_udp:
         """Construct cumulative position of Walker satellites, motherships and rovers
 
         Args:
-            walker1 (SatrecArray): Walker1 constellation satellites ready to be SGP4 propagated
-            walker2 (SatrecArray): Walker2 constellation satellites ready to be SGP4 propagated
-            pos_r (float, n_rovers x n_epochs x 3): rover x, y, z positions
+            walker1 (tuple of Satrec): Walker1 constellation satellites ready to be SGP4 propagated
+            walker2 (tuple of Satrec): Walker2 constellation satellites ready to be SGP4 propagated
+            pos_r (float, n_rovers x (n_epochs - 1) x 3): rover x, y, z positions
 
         Returns:
-            float, (S1xP1 + S2xP2 + n_motherships + n_rovers) x n_epochs x 3: overall position vector
+            float, (S1xP1 + S2xP2 + n_motherships + n_rovers) x (n_epochs - 1) x 3: overall position
+            vector (epoch 0 is excluded from propagation). The array is a view into a
+            buffer reused across calls: it is invalidated by the next construct_pos,
+            fitness or plot call on this instance, so copy it if it must outlive them.
         """
-        # Compute ephemerides for Walker1 satellites at all epochs)
-        err_w1, pos_w1, _ = walker1.sgp4(self.jds, self.frs)
-        # Compute ephemerides for Walker2 satellites at all epochs)
-        err_w2, pos_w2, _ = walker2.sgp4(self.jds, self.frs)
+        # Compute ephemerides for Walker1 and Walker2 satellites and the motherships
+        # at all epochs in a single vectorized SGP4 sweep
+        satellites = SatrecArray(list(walker1) + list(walker2) + list(self._motherships))
+        err, pos, _ = satellites.sgp4(self.jds_eval, self.frs_eval)
         # Check propagation went well
-        if not (np.all(err_w1 == 0) and np.all(err_w2 == 0)):
+        if not np.all(err == 0):
             raise ValueError("The walker constellations cannot be propagated successfully on the defined time grid")
-        # Position vector for Walker constellation satellites, motherships and rovers)
-        cum_pos = np.concatenate((pos_w1,pos_w2, self.pos_m, pos_r))
+        # Position vector for Walker constellation satellites, motherships and rovers,
+        # assembled into the preallocated buffer
+        n_sats = pos.shape[0]
+        N = n_sats + pos_r.shape[0]
+        cum_pos = self._cum_pos_buf[:N]
+        cum_pos[:n_sats] = pos
+        cum_pos[n_sats:] = pos_r
         return cum_pos
 
     def fitness(self, x, verbose=False):
         """Evaluate the fitness of the decision variables.
 
+        The fitness is deterministic in x and optimizers frequently re-evaluate
+        near-duplicate chromosomes, so evaluations are memoized on a quantized
+        key (integers exact, floats rounded to 12 decimals).
+
         Args:
             x (list): chromosome describing the New Mars communications infrastructure
             verbose (bool): If True, print some info.
@@ -435,21 +629,50 @@ class constellation_udp:
             float: fitness for total number of satellites
             float: constraint for rover positioning
         """
-        # Construct the Walker constellations based on input chromosome 
-        walker1, walker2 = self.construct_walkers(x)
+        if verbose:
+            # Verbose evaluations print diagnostics, bypass the cache
+            return self._fitness_impl(x, verbose=True)
+        # Quantized at 1e-12: exact re-evaluations (the common optimizer case)
+        # still hit, while chromosomes that genuinely differ in fitness never
+        # alias to the same entry
+        key = tuple(round(float(v), 12) for v in x)
+        if key not in self._fitness_cache:
+            if len(self._fitness_cache) >= 4096:
+                self._fitness_cache.clear()
+            self._fitness_cache[key] = self._fitness_impl(x)
+        return list(self._fitness_cache[key])
+
+    def _fitness_impl(self, x, verbose=False):
+        """The actual fitness evaluation behind the memoization (see fitness)"""
         # Extract the quality factors and the number of satellites in the Walkers
         _,_,_,_,eta1,_,_,_,_,eta2,S1,P1,_,S2,P2,_,_,_,_,_ = x
         N1 = S1 * P1
         N2 = S2 * P2
+        nf1 = 34 # f1 normalization factor
+        nf2 = 100000 # f2 normalization factor
         # Extract the rover indices from the input chromosome
         rovers_idx = np.array(x[-4:]).astype(int)
         # Look up latitude and longitudes corresponding to rover indices
         lambda0 = self.lambdas[rovers_idx]
         phi0 = self.phis[rovers_idx]
+
+        # Constraint gate: the rover-distance constraint only depends on the rover
+        # indices and is cheap, so grossly infeasible placements (violation beyond
+        # 1000 km) short-circuit before any propagation or graph construction
+        min_rover_d, d_rover_min = self.get_rover_constraint(lambda0, phi0)
+        if not verbose and min_rover_d > 1000.0:
+            f2 = eta1 * N1 + eta2 * N2
+            return [1e3, f2/nf2, min_rover_d, 1e3]
+
+        # Construct the Walker constellations based on input chromosome 
+        walker1, walker2 = self.construct_walkers(x)
         # Construct the rover positions
         rovers = self.construct_rover_pos(lambda0, phi0)
         # Concatenate the position of the Walkers, motherships and rover
         cum_pos = self.construct_pos(walker1, walker2, rovers)
+        # Epoch-major float32 layout: each epoch is then a contiguous, cache-friendly
+        # N x 3 block for build_graph (km-scale distances are well within fp32 precision)
+        cum_pos_e = cum_pos.transpose(1, 0, 2).astype(np.float32)
 
         # Evaluating the fitness function
         if verbose:
@@ -458,30 +681,30 @@ class constellation_udp:
         # First objective (minimize):
         # Compute the average shortest path between any mothership-rover pair
         # Iterate over epochs
-        f1 = 0
-        nf1 = 34 # f1 normalization factor
-        d_sat_min_ep = np.inf
-        for ep_idx in range(1, self.n_epochs):
+
+        def epoch_eval(ep_idx):
             # Constructs the graph:
             # Nodes: Walker sats + motherships + rovers
             # Edges: LOS communication
-            G, _, d_sat_min = self.build_graph(ep_idx, cum_pos, N1, (eta1, eta2))
-            if d_sat_min < d_sat_min_ep:
-                d_sat_min_ep = d_sat_min
-            f1 += self.average_shortest_path(G, self.n_motherships, self.n_rovers, ep_idx, verbose)
+            adjmatrix, d_sat_min = self.build_graph(ep_idx, cum_pos_e, N1, (eta1, eta2))
+            return self.average_shortest_path(adjmatrix, self.n_motherships, self.n_rovers, ep_idx + 1, verbose), d_sat_min
+
+        # The epoch graphs are independent: evaluate them concurrently (the heavy
+        # lifting happens in GIL-releasing Numba/SciPy code)
+        with ThreadPoolExecutor(max_workers=min(self.n_epochs - 1, os.cpu_count())) as executor:
+            results = list(executor.map(epoch_eval, range(self.n_epochs - 1)))
+        d_sat_min_ep = min(d_sat_min for _, d_sat_min in results)
 
         # Average over the number of epochs
-        f1 /= (self.n_epochs - 1)
+        f1 = sum(asp for asp, _ in results) / (self.n_epochs - 1)
 
         # Second objective (minimize):
         # Compute the total number of satellites (weighted by the quality factors)
         f2 = eta1 * N1 + eta2 * N2
-        nf2 = 100000 # f2 normalization factor
 
         # Constraints:
         # The minimum distance between any two rovers needs to be at least 3000km
-        # to ensure good coverage of the surface of New Mars
-        min_rover_d, d_rover_min = self.get_rover_constraint(lambda0, phi0)
+        # to ensure good coverage of the surface of New Mars (computed above)
         # The minimum distance between any two nodes of the graph across all epochs 
         # needs to be at least 50km to ensure a collision-free communications network
         min_sat_d = self.get_sat_constraint(d_sat_min_ep) 
@@ -490,11 +713,11 @@ class constellation_udp:
         if verbose:
             print(100 * "-")
             print("RESULTS:")
-            print("Total number of satellites (W1: {}, W2: {}): {}".format(N1, N2, N1+N2))
-            print("OBJECTIVE #1 - Average communications cost: {}".format(f1/nf1))
-            print("OBJECTIVE #2 - Cost of infrastructure: {}".format(f2/nf2))
-            print("CONSTRAINT - Minimum distance between rovers ({}): {} km".format("NOK" if min_rover_d > 0 else "OK", d_rover_min))
-            print("CONSTRAINT - Minimum distance between sats ({}): {} km".format("NOK" if min_sat_d > 0 else "OK", d_sat_min_ep))
+            print(f"Total number of satellites (W1: {N1}, W2: {N2}): {N1+N2}")
+            print(f"OBJECTIVE #1 - Average communications cost: {f1/nf1}")
+            print(f"OBJECTIVE #2 - Cost of infrastructure: {f2/nf2}")
+            print(f"CONSTRAINT - Minimum distance between rovers ({'NOK' if min_rover_d > 0 else 'OK'}): {d_rover_min} km")
+            print(f"CONSTRAINT - Minimum distance between sats ({'NOK' if min_sat_d > 0 else 'OK'}): {d_sat_min_ep} km")
             print(100 * "-")
         return [f1/nf1, f2/nf2, min_rover_d, min_sat_d]
     
@@ -555,21 +778,21 @@ class constellation_udp:
         """Compute one full-orbit of the Walker constellation planes (for plots)
 
         Args:
-            walker (sgp4.SatrecArray): the array of Walker satellites to plot
+            walker (tuple of Satrec): the Walker satellites to plot
             ep0 (float): Julian date denoting starting epoch
             sma (float): semi-major axis of orbit
 
         Returns:
             pos (numpy array, P x N x 3): N orbital x, y, z positions for P planes
         """
-        
+
         # Extract mean motion
         mean_motion = np.sqrt(pk.MU_EARTH / sma**3 / pk.EARTH_RADIUS**3) * 24 * 60 * 60 / (2 * np.pi)
         # Compute time range for one full orbit
         jds = np.linspace(ep0, ep0 + 1 / mean_motion, 100)
         frs = jds * 0.0
         # Propagate using SGP4
-        err, pos, _ = walker.sgp4(jds, frs)
+        err, pos, _ = SatrecArray(list(walker)).sgp4(jds, frs)
         if not np.all(err == 0):
             raise ValueError("The satellite cannot be propagated successfully on the defined time grid")
         
@@ -611,7 +834,8 @@ class constellation_udp:
             x (list): chromosome describing the communications network
             src (int): mothership index denoting path source
             dst (int): rover index denoting path destination
-            ep (int): index of the epoch in the predefined time grid
+            ep (int): index of the epoch in the predefined time grid (>= 1:
+                epoch 0 is not propagated, see construct_pos)
             lims (float, optional): plot limits. Defaults to 10000.
             ax (matplotlib 3D axis, optional): plot axis.
             dark_mode (bool, optional): dark background for plot (recommended)
@@ -621,16 +845,25 @@ class constellation_udp:
             list: indices of the graph nodes on the communications path (if one is found, otherwise [])
         """
         
-        # Create the plotting axis if needed
+        # Create the plotting axis if needed; when none is passed in, one figure
+        # is created on the first call and reused (cleared) on subsequent ones,
+        # so repeated plotting does not rebuild the whole figure each time
         if ax is None:
-            fig = plt.figure()
-            ax = fig.add_subplot(projection='3d')
+            if self._plot_ax is None or self._plot_ax.figure.number not in plt.get_fignums():
+                fig = plt.figure()
+                self._plot_ax = fig.add_subplot(projection='3d')
+            ax = self._plot_ax
+            ax.clear()
 
         # Apply a dark background for better visualization
         if dark_mode:
             sns.set(style="darkgrid")
             plt.style.use("dark_background")
             
+        # Positions are only propagated on the evaluation grid (epoch 0 is excluded)
+        if ep < 1:
+            raise ValueError("ep must be >= 1: epoch 0 is not propagated")
+        ep_i = ep - 1
         # Construct the two Walker constellations from the specifications 
         walker1, walker2 = self.construct_walkers(x)
         # Construct the rover positions
@@ -656,65 +889,108 @@ class constellation_udp:
         for i in range(len(mothership_orb)):
             ax.plot(mothership_orb[i, :, 0], mothership_orb[i, :, 1], mothership_orb[i, :, 2], 'w-', linewidth=0.5)
 
-        # Overlay the Walker satellite and mothership positions at epoch ep 
+        # Contiguous (N, 3) view of the plotted epoch: all scatter/text/path
+        # drawing below indexes this single block instead of re-slicing pos
+        pos_ep = np.ascontiguousarray(pos[:, ep_i, :])
+        # Overlay the Walker satellite and mothership positions at epoch ep
+        # in a single batched scatter (matplotlib rendering cost scales with
+        # the artist count)
         # Walker1: red, Walker2: blue, motherships: white, rovers: yellow
-        ax.scatter(pos[:len(walker1),ep,0], pos[:len(walker1),ep,1], pos[:len(walker1),ep,2], c='r', marker="1", s=200)
-        ax.scatter(pos[len(walker1):-self.n_motherships-self.n_rovers,ep,0], pos[len(walker1):-self.n_motherships-self.n_rovers,ep,1], pos[len(walker1):-self.n_motherships-self.n_rovers,ep,2], c='b', marker="1", s=200)
-        ax.scatter(pos[-self.n_motherships-self.n_rovers:-self.n_rovers,ep,0], pos[-self.n_motherships-self.n_rovers:-self.n_rovers,ep,1], pos[-self.n_motherships-self.n_rovers:-self.n_rovers,ep,2], c='w', marker="1", s=300)
+        n_w1 = len(walker1)
+        n_sats = pos_ep.shape[0] - self.n_rovers
+        colors = ['r'] * n_w1 + ['b'] * (n_sats - self.n_motherships - n_w1) + ['w'] * self.n_motherships
+        sizes = [200] * (n_sats - self.n_motherships) + [300] * self.n_motherships
+        ax.scatter(pos_ep[:n_sats,0], pos_ep[:n_sats,1], pos_ep[:n_sats,2], c=colors, marker="1", s=sizes)
         # Annotate source nodes (motherships)
+        pos_mship = pos_ep[-self.n_motherships-self.n_rovers:-self.n_rovers]
         for i in range(self.n_motherships):
-            ax.text(pos[-self.n_motherships-self.n_rovers+i,ep,0], pos[-self.n_motherships-self.n_rovers+i,ep,1], pos[-self.n_motherships-self.n_rovers+i,ep,2],  '%s' % (str(i+1)), size=20, zorder=1,  color='w')         
-        
+            ax.text(pos_mship[i,0], pos_mship[i,1], pos_mship[i,2],  '%s' % (str(i+1)), size=20, zorder=1,  color='w')
+
         # Annotate destination nodes (rovers)
-        ax.scatter(pos[-self.n_rovers:,ep,0], pos[-self.n_rovers:,ep,1], pos[-self.n_rovers:,ep,2], c='y', marker="^", s=200)
+        pos_rover = pos_ep[-self.n_rovers:]
+        ax.scatter(pos_rover[:,0], pos_rover[:,1], pos_rover[:,2], c='y', marker="^", s=200)
         for i in range(self.n_rovers):
-            ax.text(pos[-self.n_rovers+i,ep,0], pos[-self.n_rovers+i,ep,1], pos[-self.n_rovers+i,ep,2],  '%s' % (str(i+1)), size=20, zorder=1,  color='y') 
+            ax.text(pos_rover[i,0], pos_rover[i,1], pos_rover[i,2],  '%s' % (str(i+1)), size=20, zorder=1,  color='y')
 
-        # Build the communications network
+        # Build the communications network (cached across plot calls: the graph only
+        # depends on the epoch and the chromosome, and users commonly re-plot many
+        # src/dst pairs of the same design)
         path = []
         eta1, eta2 = x[4], x[9]
-        G, _, _ = self.build_graph(ep, pos, N1, (eta1, eta2))
-        N = len(G)
-        src_node = N1 + N2 + src - 1
-        dst_node = N1 + N2 + self.n_motherships + dst - 1
-        # Find the shortest path (if one exists)
-        try:
-            path = nx.shortest_path(G, src_node, dst_node, weight="weight", method="dijkstra")
+        graph_key = (ep_i, tuple(round(float(v), 12) for v in x))
+        if graph_key not in self._plot_graph_cache:
+            if len(self._plot_graph_cache) >= 64:
+                self._plot_graph_cache.clear()
+            # Epoch-major contiguous float32 copy, same layout the fitness path
+            # hands to build_graph (contiguous rows for the pairwise kernel)
+            adjmatrix, _ = self.build_graph(ep_i, np.ascontiguousarray(pos.transpose(1, 0, 2)), N1, (eta1, eta2))
+            # The component labels ride along in the cache: one linear-time sweep
+            # answers reachability for every subsequent (src, dst) pair
+            _, labels = connected_components(adjmatrix, directed=False)
+            self._plot_graph_cache[graph_key] = (adjmatrix, labels)
+        adjmatrix, labels = self._plot_graph_cache[graph_key]
+        # Node numbering: walker satellites first, then motherships, then rovers
+        src_base = N1 + N2 - 1
+        src_node = src_base + src
+        dst_node = src_base + self.n_motherships + dst
+        if labels[src_node] != labels[dst_node]:
+            # Different connected components: skip the Dijkstra sweep entirely
+            logger.debug("Mothership %d (node %d) cannot reach rover %d (node %d) at epoch %d",
+                         src, src_node, dst, dst_node, ep)
+        else:
+            # Find the shortest path: a single-source compiled Dijkstra with
+            # predecessors, instead of the NetworkX per-edge Python traversal
+            _, pred = dijkstra(csgraph=adjmatrix, directed=False, indices=src_node,
+                               return_predecessors=True)
+            # Walk the predecessor array back from the destination
+            path = _walk_predecessors(pred, src_node, dst_node)
             for i,j in zip(path[:-1], path[1:]):
-                ax.plot([pos[i,ep,0], pos[j,ep,0]], [pos[i,ep,1], pos[j,ep,1]], [pos[i,ep,2], pos[j,ep,2]], 'g-.', linewidth=3)
-            print("Mothership {} (node {}) communicates with rover {} (node {}) at epoch {} via: {}".format(\
-                src, src_node, dst,  dst_node, ep, path))
-        except nx.exception.NetworkXNoPath as e:
-            print("Mothership {} (node {}) cannot reach rover {} (node {}) at epoch {}".format(\
-                src, src_node, dst,  dst_node, ep))
+                ax.plot([pos_ep[i,0], pos_ep[j,0]], [pos_ep[i,1], pos_ep[j,1]], [pos_ep[i,2], pos_ep[j,2]], 'g-.', linewidth=3)
+            logger.debug("Mothership %d (node %d) communicates with rover %d (node %d) at epoch %d via: %s",
+                         src, src_node, dst, dst_node, ep, path)
 
         # Plot the New Mars planet
         r = pk.EARTH_RADIUS/1000
-        u, v = np.mgrid[0:2 * np.pi:30j, 0:np.pi:20j]
-        x = r * np.cos(u) * np.sin(v)
-        y = r * np.sin(u) * np.sin(v)
-        z = r * np.cos(v)
-        ax.plot_surface(x, y, z, alpha=0.3, color="purple", linewidth=0)
+        if constellation_udp._UNIT_SPHERE is None:
+            u, v = np.mgrid[0:2 * np.pi:30j, 0:np.pi:20j]
+            constellation_udp._UNIT_SPHERE = ((np.cos(u) * np.sin(v)).astype(np.float32),
+                                              (np.sin(u) * np.sin(v)).astype(np.float32),
+                                              np.cos(v).astype(np.float32))
+        xu, yu, zu = constellation_udp._UNIT_SPHERE
+        ax.plot_surface(r * xu, r * yu, r * zu, alpha=0.3, color="purple", linewidth=0)
         ax.set_axis_off()
         ax.set_xlim(-lims,lims)
         ax.set_ylim(-lims,lims)
         ax.set_zlim(-lims,lims)
-        ax.set_box_aspect([ub - lb for lb, ub in (getattr(ax, f'get_{a}lim')() for a in 'xyz')])
+        # The three axes were just given identical limits, so the box aspect is cubic
+        ax.set_box_aspect((1, 1, 1))
         return ax, path
 
 def combine_scores(points):
-    """ Function for aggregating single solutions into one score using hypervolume indicator """
-    import pygmo as pg
+    """ Function for aggregating single solutions into one score using hypervolume indicator
+    (pure NumPy: no per-call pygmo import, so high-frequency callers pay no import machinery cost) """
     ref_point = np.array([1.2, 1.4])
-    
+
     # solutions that not dominate the reference point are excluded
-    filtered_points = [s[:2] for s in points if pg.pareto_dominance(s[:2], ref_point)]
-    
+    # (one vectorized dominance test over all solutions at once)
+    if len(points) == 0:
+        return 0.0
+    arr = np.asarray(points, dtype=np.float64)[:, :2]
+    mask = (arr <= ref_point).all(axis=1) & (arr < ref_point).any(axis=1)
+    filtered_points = arr[mask]
+
     if len(filtered_points) == 0:
         return 0.0
     else:
-        hv = pg.hypervolume(filtered_points)
-        return -hv.compute(ref_point)
+        # In 2D the hypervolume reduces to a sort-and-sweep: lexsort by (f1, f2),
+        # keep only the non-dominated points via a running minimum over f2, then
+        # accumulate the rectangles left of the reference point
+        pts = np.asarray(filtered_points)
+        order = np.lexsort((pts[:, 1], pts[:, 0]))
+        a = pts[order]
+        front = a[a[:, 1] < np.minimum.accumulate(np.r_[np.inf, a[:-1, 1]])]
+        widths = np.diff(np.append(front[:, 0], ref_point[0]))
+        return -float(np.sum(widths * (ref_point[1] - front[:, 1])))
 
 # Optimize udp        
 udp = constellation_udp()
\ No newline at end of file